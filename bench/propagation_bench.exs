@@ -0,0 +1,107 @@
+# Propagation benchmark
+#
+# Run with: mix run bench/propagation_bench.exs
+#
+# Times propagating one satellite to a list of epochs, first one call per
+# epoch and then as a single batch call, and reports the cost per epoch.
+# Both use the same initialized satellite; the one-shot TLE path, which
+# parses and initializes on every call, is reported on a line of its own.
+# A list of satellites propagated to one epoch in a single call is timed the
+# same way.
+# The TEME to geodetic conversion is timed on its own so it can be compared
+# with the propagation cost.
+# The cold first calls and the warm-up are reported separately from these
+# steady-state timings, so one-off loading costs are not averaged in.
+
+line1 = "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993"
+line2 = "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+
+{:ok, tle} = Sgp4Ex.parse_tle(line1, line2)
+
+# Cold calls: the first NIF calls also pay for loading the module and the
+# shared library, so they are timed once before anything else runs
+{init_us, {:ok, satellite}} = :timer.tc(fn -> Sgp4Ex.init_satellite(tle) end)
+{first_us, {:ok, _}} =
+  :timer.tc(fn -> Sgp4Ex.propagate_satellite_to_epoch(satellite, tle.epoch) end)
+
+count = 100
+epochs = for minute <- 1..count, do: DateTime.add(tle.epoch, minute * 60, :second)
+
+per_epoch = fn ->
+  Enum.each(epochs, &({:ok, _} = Sgp4Ex.propagate_satellite_to_epoch(satellite, &1)))
+end
+
+uncached = fn -> Enum.each(epochs, &({:ok, _} = Sgp4Ex.propagate_tle_to_epoch(tle, &1))) end
+batch = fn -> Sgp4Ex.propagate_satellite_to_epochs(satellite, epochs) end
+
+satellites = List.duplicate(satellite, count)
+target = List.last(epochs)
+constellation = fn -> Sgp4Ex.propagate_satellites_to_epoch(satellites, target) end
+constellation_geodetic = fn -> Sgp4Ex.propagate_satellites_to_geodetic(satellites, target) end
+
+# Precomputed states, so the geodetic step is timed without propagation
+positions = for {{:ok, state}, epoch} <- Enum.zip(batch.(), epochs), do: {state.position, epoch}
+
+geodetic = fn ->
+  Enum.each(positions, fn {position, epoch} ->
+    {:ok, _} = Sgp4Ex.CoordinateSystems.teme_to_geodetic(position, epoch)
+  end)
+end
+
+# Warm up every path before timing
+{warmup_us, _} =
+  :timer.tc(fn ->
+    for _ <- 1..5 do
+      per_epoch.()
+      uncached.()
+      batch.()
+      constellation.()
+      constellation_geodetic.()
+      geodetic.()
+    end
+  end)
+
+samples = 100
+rounds = 10
+
+# Each sample times `rounds` back-to-back calls so clock reads are a small
+# part of the measurement, after a garbage collection so a collection of
+# earlier garbage is not charged to it. Samples are integer nanoseconds from
+# the monotonic clock; they are converted to µs per item only when reported.
+sample = fn fun ->
+  :erlang.garbage_collect()
+  start = :erlang.monotonic_time(:nanosecond)
+  Enum.each(1..rounds, fn _ -> fun.() end)
+  :erlang.monotonic_time(:nanosecond) - start
+end
+
+# Nanoseconds per sample to µs per item
+ns_per_us_item = 1000 * rounds * count
+
+# Time `fun` over all samples and summarize the per-item cost. The samples
+# are sorted once and both min and median are read off that sorted list.
+report = fn label, fun, unit ->
+  sorted = Enum.sort(for _ <- 1..samples, do: sample.(fun))
+
+  min = hd(sorted) / ns_per_us_item
+  median = Enum.at(sorted, div(samples, 2)) / ns_per_us_item
+  mean = Enum.sum(sorted) / (samples * ns_per_us_item)
+
+  IO.puts(
+    "  #{label} mean #{Float.round(mean, 3)}, min #{Float.round(min, 3)}, " <>
+      "median #{Float.round(median, 3)} µs/#{unit}"
+  )
+end
+
+IO.puts("Cold start")
+IO.puts("  first init_satellite: #{init_us} µs")
+IO.puts("  first propagation:    #{first_us} µs")
+IO.puts("  warm-up (5 rounds of every path): #{Float.round(warmup_us / 1000, 3)} ms")
+IO.puts("Propagating #{count} epochs (#{samples} samples of #{rounds} calls)")
+report.("one call per epoch:", per_epoch, "epoch")
+report.("single batch call: ", batch, "epoch")
+report.("uncached TLE call: ", uncached, "epoch")
+report.("geodetic only:     ", geodetic, "epoch")
+IO.puts("Propagating #{count} satellites to one epoch (#{samples} samples of #{rounds} calls)")
+report.("single batch call: ", constellation, "satellite")
+report.("batch to geodetic: ", constellation_geodetic, "satellite")
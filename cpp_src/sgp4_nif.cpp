@@ -1,23 +1,26 @@
 #include <erl_nif.h>
+#include <vector>
 #include "SGP4.h"
 
-static ERL_NIF_TERM propagate_tle(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
-    ErlNifBinary line1, line2;
-    double tsince;
+// Resource holding an initialized satellite record so repeated propagations
+// of the same TLE skip parsing and SGP4 initialization
+static ErlNifResourceType* satrec_resource_type = NULL;
 
-    // Validate input arguments: two binaries (TLE lines) and a float (time since epoch)
-    if (argc != 3 ||
-        !enif_inspect_binary(env, argv[0], &line1) ||
-        !enif_inspect_binary(env, argv[1], &line2) ||
-        !enif_get_double(env, argv[2], &tsince)) {
-        return enif_make_badarg(env);
-    }
+static ERL_NIF_TERM make_error(ErlNifEnv* env, const char* message) {
+    return enif_make_tuple2(env, enif_make_atom(env, "error"),
+                            enif_make_string(env, message, ERL_NIF_LATIN1));
+}
 
+// Parse two TLE lines and initialize the satellite record.
+// On failure stores an error tuple in `error` and returns false.
+static bool init_satrec_from_tle(ErlNifEnv* env, const ErlNifBinary& line1,
+                                 const ErlNifBinary& line2, elsetrec& satrec,
+                                 ERL_NIF_TERM* error) {
     // Ensure TLE lines are null-terminated strings
     char tle1[70], tle2[70];
     if (line1.size >= 70 || line2.size >= 70) {
-        return enif_make_tuple2(env, enif_make_atom(env, "error"),
-                                enif_make_string(env, "TLE lines too long", ERL_NIF_LATIN1));
+        *error = make_error(env, "TLE lines too long");
+        return false;
     }
     memcpy(tle1, line1.data, line1.size);
     tle1[line1.size] = '\0';
@@ -25,7 +28,6 @@ static ERL_NIF_TERM propagate_tle(ErlNifEnv* env, int argc, const ERL_NIF_TERM a
     tle2[line2.size] = '\0';
 
     // Initialize satellite record
-    elsetrec satrec;
     char typerun = 'c'; // Catalog mode
     char typeinput = 's'; // Seconds from epoch
     char opsmode = 'i'; // Improved mode
@@ -38,37 +40,203 @@ static ERL_NIF_TERM propagate_tle(ErlNifEnv* env, int argc, const ERL_NIF_TERM a
     if (satrec.error != 0) {
         char error_msg[50];
         snprintf(error_msg, sizeof(error_msg), "TLE initialization error: %d", satrec.error);
-        return enif_make_tuple2(env, enif_make_atom(env, "error"),
-                                enif_make_string(env, error_msg, ERL_NIF_LATIN1));
+        *error = make_error(env, error_msg);
+        return false;
     }
 
-    // Propagate to specified time
+    return true;
+}
+
+// Propagate an initialized satellite record to the specified time.
+// On success stores {position, velocity} in `result`, otherwise stores an
+// error tuple. The state is in km and km/s, the units SGP4 works in.
+// The record is updated in place by SGP4.
+static bool propagate_satrec_to(ErlNifEnv* env, elsetrec& satrec, double tsince,
+                                ERL_NIF_TERM* result) {
     double r[3], v[3]; // Position (km) and velocity (km/s) in TEME
-    bool result = SGP4Funcs::sgp4(satrec, tsince, r, v);
+    bool ok = SGP4Funcs::sgp4(satrec, tsince, r, v);
 
-    if (!result || satrec.error != 0) {
+    if (!ok || satrec.error != 0) {
         char error_msg[50];
         snprintf(error_msg, sizeof(error_msg), "Propagation error: %d", satrec.error);
-        return enif_make_tuple2(env, enif_make_atom(env, "error"),
-                                enif_make_string(env, error_msg, ERL_NIF_LATIN1));
+        *result = make_error(env, error_msg);
+        return false;
     }
 
-    // Create return tuple: {:ok, {position, velocity}} (return in base SI units)
     ERL_NIF_TERM pos = enif_make_tuple3(env,
-        enif_make_double(env, r[0] * 1000),
-        enif_make_double(env, r[1] * 1000),
-        enif_make_double(env, r[2] * 1000));
+        enif_make_double(env, r[0]),
+        enif_make_double(env, r[1]),
+        enif_make_double(env, r[2]));
     ERL_NIF_TERM vel = enif_make_tuple3(env,
-        enif_make_double(env, v[0] * 1000),
-        enif_make_double(env, v[1] * 1000),
-        enif_make_double(env, v[2] * 1000));
-    ERL_NIF_TERM state = enif_make_tuple2(env, pos, vel);
+        enif_make_double(env, v[0]),
+        enif_make_double(env, v[1]),
+        enif_make_double(env, v[2]));
+    *result = enif_make_tuple2(env, pos, vel);
+    return true;
+}
+
+static ERL_NIF_TERM propagate_tle(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
+    ErlNifBinary line1, line2;
+    double tsince;
+
+    // Validate input arguments: two binaries (TLE lines) and a float (time since epoch)
+    if (argc != 3 ||
+        !enif_inspect_binary(env, argv[0], &line1) ||
+        !enif_inspect_binary(env, argv[1], &line2) ||
+        !enif_get_double(env, argv[2], &tsince)) {
+        return enif_make_badarg(env);
+    }
+
+    elsetrec satrec;
+    ERL_NIF_TERM error;
+    if (!init_satrec_from_tle(env, line1, line2, satrec, &error)) {
+        return error;
+    }
+
+    // Create return tuple: {:ok, {position, velocity}} (in km and km/s)
+    ERL_NIF_TERM state;
+    if (!propagate_satrec_to(env, satrec, tsince, &state)) {
+        return state;
+    }
+    return enif_make_tuple2(env, enif_make_atom(env, "ok"), state);
+}
+
+static ERL_NIF_TERM init_satrec(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
+    ErlNifBinary line1, line2;
+
+    // Validate input arguments: two binaries (TLE lines)
+    if (argc != 2 ||
+        !enif_inspect_binary(env, argv[0], &line1) ||
+        !enif_inspect_binary(env, argv[1], &line2)) {
+        return enif_make_badarg(env);
+    }
+
+    elsetrec* satrec = (elsetrec*)enif_alloc_resource(satrec_resource_type, sizeof(elsetrec));
+    ERL_NIF_TERM error;
+    if (!init_satrec_from_tle(env, line1, line2, *satrec, &error)) {
+        enif_release_resource(satrec);
+        return error;
+    }
+
+    // Hand ownership of the record to the garbage collector
+    ERL_NIF_TERM ref = enif_make_resource(env, satrec);
+    enif_release_resource(satrec);
+    return enif_make_tuple2(env, enif_make_atom(env, "ok"), ref);
+}
+
+static ERL_NIF_TERM propagate_satrec(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
+    elsetrec* initialized;
+    double tsince;
+
+    // Validate input arguments: a satellite record and a float (time since epoch)
+    if (argc != 2 ||
+        !enif_get_resource(env, argv[0], satrec_resource_type, (void**)&initialized) ||
+        !enif_get_double(env, argv[1], &tsince)) {
+        return enif_make_badarg(env);
+    }
+
+    // SGP4 writes into the record while propagating, and the resource may be
+    // used from several processes on different schedulers at once, so work on
+    // a copy rather than racing on the shared record
+    elsetrec satrec = *initialized;
+
+    // Create return tuple: {:ok, {position, velocity}} (in km and km/s)
+    ERL_NIF_TERM state;
+    if (!propagate_satrec_to(env, satrec, tsince, &state)) {
+        return state;
+    }
     return enif_make_tuple2(env, enif_make_atom(env, "ok"), state);
 }
 
+static ERL_NIF_TERM propagate_satrec_batch(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
+    elsetrec* initialized;
+    unsigned length;
+
+    // Validate input arguments: a satellite record and a list of floats (times since epoch)
+    if (argc != 2 ||
+        !enif_get_resource(env, argv[0], satrec_resource_type, (void**)&initialized) ||
+        !enif_get_list_length(env, argv[1], &length)) {
+        return enif_make_badarg(env);
+    }
+
+    // Propagate every time in one call (in km and km/s). Each time gets its own
+    // {:ok, {position, velocity}} or error tuple, so a time past decay does not
+    // discard the others.
+    std::vector<ERL_NIF_TERM> results(length);
+    ERL_NIF_TERM list = argv[1], head;
+    for (unsigned i = 0; enif_get_list_cell(env, list, &head, &list); i++) {
+        double tsince;
+        if (!enif_get_double(env, head, &tsince)) {
+            return enif_make_badarg(env);
+        }
+
+        // Start each time from the initialized record, as propagate_satrec does
+        elsetrec satrec = *initialized;
+        ERL_NIF_TERM state;
+        if (propagate_satrec_to(env, satrec, tsince, &state)) {
+            results[i] = enif_make_tuple2(env, enif_make_atom(env, "ok"), state);
+        } else {
+            results[i] = state;
+        }
+    }
+
+    return enif_make_list_from_array(env, results.data(), length);
+}
+
+static ERL_NIF_TERM propagate_satrecs(ErlNifEnv* env, int argc, const ERL_NIF_TERM argv[]) {
+    unsigned length, tsince_length;
+
+    // Validate input arguments: a list of satellite records and, for each one,
+    // a float (time since that record's epoch)
+    if (argc != 2 ||
+        !enif_get_list_length(env, argv[0], &length) ||
+        !enif_get_list_length(env, argv[1], &tsince_length) ||
+        length != tsince_length) {
+        return enif_make_badarg(env);
+    }
+
+    // Propagate every satellite in one call (in km and km/s). Each satellite gets
+    // its own {:ok, {position, velocity}} or error tuple, so one decayed object
+    // does not discard the rest of the list.
+    std::vector<ERL_NIF_TERM> results(length);
+    ERL_NIF_TERM satrecs = argv[0], tsinces = argv[1], satrec_term, tsince_term;
+    for (unsigned i = 0; enif_get_list_cell(env, satrecs, &satrec_term, &satrecs) &&
+                         enif_get_list_cell(env, tsinces, &tsince_term, &tsinces); i++) {
+        elsetrec* initialized;
+        double tsince;
+        if (!enif_get_resource(env, satrec_term, satrec_resource_type, (void**)&initialized) ||
+            !enif_get_double(env, tsince_term, &tsince)) {
+            return enif_make_badarg(env);
+        }
+
+        elsetrec satrec = *initialized;
+        ERL_NIF_TERM state;
+        if (propagate_satrec_to(env, satrec, tsince, &state)) {
+            results[i] = enif_make_tuple2(env, enif_make_atom(env, "ok"), state);
+        } else {
+            results[i] = state;
+        }
+    }
+
+    return enif_make_list_from_array(env, results.data(), length);
+}
+
+static int load(ErlNifEnv* env, void** priv_data, ERL_NIF_TERM load_info) {
+    satrec_resource_type = enif_open_resource_type(env, NULL, "satrec", NULL,
+                                                   ERL_NIF_RT_CREATE, NULL);
+    return satrec_resource_type == NULL ? -1 : 0;
+}
+
 // NIF initialization
+// The batch NIFs run for as long as their input lists, so they are scheduled
+// on dirty CPU schedulers: they do not block normal schedulers, and batches
+// from several processes propagate on separate cores at the same time.
 static ErlNifFunc nif_funcs[] = {
-    {"propagate_tle", 3, propagate_tle}
+    {"propagate_tle", 3, propagate_tle},
+    {"init_satrec", 2, init_satrec},
+    {"propagate_satrec", 2, propagate_satrec},
+    {"propagate_satrec_batch", 2, propagate_satrec_batch, ERL_NIF_DIRTY_JOB_CPU_BOUND},
+    {"propagate_satrecs", 2, propagate_satrecs, ERL_NIF_DIRTY_JOB_CPU_BOUND}
 };
 
-ERL_NIF_INIT(Elixir.SGP4NIF, nif_funcs, NULL, NULL, NULL, NULL)
\ No newline at end of file
+ERL_NIF_INIT(Elixir.SGP4NIF, nif_funcs, load, NULL, NULL, NULL)
@@ -17,6 +17,21 @@ defmodule Sgp4Ex.CoordinateSystems do
   @wgs84_f 1.0 / 298.257223563
   # First eccentricity squared
   @wgs84_e2 2.0 * @wgs84_f - @wgs84_f * @wgs84_f
+  # Polar radius in km
+  @wgs84_b @wgs84_a * :math.sqrt(1.0 - @wgs84_e2)
+  # Second eccentricity squared
+  @wgs84_ep2 @wgs84_e2 / (1.0 - @wgs84_e2)
+
+  # One full turn in radians
+  @two_pi 2.0 * :math.pi()
+
+  # Angle unit conversion factors, folded at compile time
+  @deg_to_rad :math.pi() / 180.0
+  @rad_to_deg 180.0 / :math.pi()
+
+  # Small arithmetic helpers on the conversion path are inlined by the compiler
+  @compile {:inline, sin_cos_of_atan2: 2, refine_latitude: 4, rem_float: 2}
+  @compile {:inline, rotate_teme_to_ecef: 2}
 
   @doc """
   Convert TEME position to geodetic coordinates (latitude, longitude, altitude).
@@ -43,20 +58,55 @@ defmodule Sgp4Ex.CoordinateSystems do
     ecef_to_geodetic({x_ecef, y_ecef, z_ecef})
   end
 
+  @doc """
+  Convert a list of TEME positions at the same datetime to geodetic coordinates.
+
+  Equivalent to calling `teme_to_geodetic/2` for every position, but the
+  TEME to ECEF rotation for `datetime` is computed once and shared by the
+  whole list.
+
+  ## Parameters
+  - `teme_positions` - Positions in TEME frame {x, y, z} in km
+  - `datetime` - UTC datetime for all of the positions
+
+  ## Returns
+  `{:ok, [%{latitude: lat, longitude: lon, altitude_km: alt}]}`, in the order
+  of `teme_positions`, with the same fields as `teme_to_geodetic/2`.
+  """
+  @spec teme_positions_to_geodetic([{float, float, float}], DateTime.t()) ::
+          {:ok, [%{latitude: float, longitude: float, altitude_km: float}]}
+  def teme_positions_to_geodetic(teme_positions, datetime) when is_list(teme_positions) do
+    rotation = gmst_rotation(datetime)
+
+    geodetics =
+      Enum.map(teme_positions, fn teme_position ->
+        {:ok, geodetic} = teme_position |> rotate_teme_to_ecef(rotation) |> ecef_to_geodetic()
+        geodetic
+      end)
+
+    {:ok, geodetics}
+  end
+
   @doc """
   Convert TEME coordinates to ECEF (Earth-Centered Earth-Fixed).
 
   Uses simplified conversion without polar motion corrections.
   """
   @spec teme_to_ecef({float, float, float}, DateTime.t()) :: {float, float, float}
-  def teme_to_ecef({x_teme, y_teme, z_teme}, datetime) do
+  def teme_to_ecef(teme_position, datetime) do
+    rotate_teme_to_ecef(teme_position, gmst_rotation(datetime))
+  end
+
+  # Rotation matrix from TEME to ECEF (rotation about Z-axis by GMST), kept as
+  # the cosine and sine of the angle since that is all the rotation needs
+  defp gmst_rotation(datetime) do
     # Calculate Greenwich Mean Sidereal Time
     gmst_rad = calculate_gmst(datetime)
 
-    # Rotation matrix from TEME to ECEF (rotation about Z-axis by GMST)
-    cos_gmst = cos(gmst_rad)
-    sin_gmst = sin(gmst_rad)
+    {cos(gmst_rad), sin(gmst_rad)}
+  end
 
+  defp rotate_teme_to_ecef({x_teme, y_teme, z_teme}, {cos_gmst, sin_gmst}) do
     # Apply rotation by GMST
     x_ecef = cos_gmst * x_teme + sin_gmst * y_teme
     y_ecef = -sin_gmst * x_teme + cos_gmst * y_teme
@@ -68,8 +118,8 @@ defmodule Sgp4Ex.CoordinateSystems do
   @doc """
   Convert ECEF Cartesian coordinates to geodetic (lat/lon/alt).
 
-  Uses iterative algorithm to account for Earth's ellipsoid shape.
-  Based on Vallado's algorithm.
+  Accounts for Earth's ellipsoid shape with Bowring's closed-form latitude,
+  polished by one step of Vallado's iterative algorithm.
   """
   @spec ecef_to_geodetic({float, float, float}) ::
           {:ok, %{latitude: float, longitude: float, altitude_km: float}}
@@ -77,45 +127,39 @@ defmodule Sgp4Ex.CoordinateSystems do
     # Calculate longitude (straightforward)
     lon_rad = atan2(y, x)
 
-    # For latitude and altitude, use iterative method
+    # For latitude and altitude, use Bowring's method
     r = sqrt(x * x + y * y)
 
-    # Initial guess for latitude
-    lat_rad = atan2(z, r)
-
-    # Iterate to refine latitude (typically converges in 3 iterations)
-    lat_rad =
-      Enum.reduce(1..3, lat_rad, fn _, lat ->
-        sin_lat = sin(lat)
-        cos_lat = cos(lat)
-        n = @wgs84_a / sqrt(1.0 - @wgs84_e2 * sin_lat * sin_lat)
-
-        # Avoid division by zero at poles
-        if abs(cos_lat) < 1.0e-10 do
-          lat
-        else
-          h = r / cos_lat - n
-          atan2(z, r * (1.0 - @wgs84_e2 * n / (n + h)))
-        end
-      end)
+    # Latitude is carried as the arguments of atan2(num, den) so its sine and
+    # cosine come straight from them instead of from atan2, sin and cos.
+    # Bowring's estimate works from the parametric latitude atan2(z a, r b).
+    {sin_beta, cos_beta} = sin_cos_of_atan2(z * @wgs84_a, r * @wgs84_b)
+    bowring_num = z + @wgs84_ep2 * @wgs84_b * sin_beta * sin_beta * sin_beta
+    bowring_den = r - @wgs84_e2 * @wgs84_a * cos_beta * cos_beta * cos_beta
+
+    # A single fixed-point step brings it to about 1e-9 degrees, below what
+    # three iterations from the geocentric latitude used to reach
+    {lat_num, lat_den} = refine_latitude(bowring_num, bowring_den, r, z)
+
+    lat_rad = atan2(lat_num, lat_den)
 
     # Calculate altitude
-    sin_lat = sin(lat_rad)
+    {sin_lat, cos_lat} = sin_cos_of_atan2(lat_num, lat_den)
     n = @wgs84_a / sqrt(1.0 - @wgs84_e2 * sin_lat * sin_lat)
 
     # 45 degrees
     altitude_km =
       if abs(lat_rad) < 0.785398 do
         # Near equator, use horizontal distance
-        r / cos(lat_rad) - n
+        r / cos_lat - n
       else
         # Near poles, use vertical distance
         z / sin_lat - n * (1.0 - @wgs84_e2)
       end
 
     # Convert to degrees
-    lat_deg = lat_rad * 180.0 / pi()
-    lon_deg = lon_rad * 180.0 / pi()
+    lat_deg = lat_rad * @rad_to_deg
+    lon_deg = lon_rad * @rad_to_deg
 
     {:ok,
      %{
@@ -125,65 +169,92 @@ defmodule Sgp4Ex.CoordinateSystems do
      }}
   end
 
+  # One fixed-point step of the latitude iteration, from the latitude given as
+  # atan2(num, den) to the refined atan2(z, den')
+  defp refine_latitude(num, den, r, z) do
+    {sin_lat, cos_lat} = sin_cos_of_atan2(num, den)
+    n = @wgs84_a / sqrt(1.0 - @wgs84_e2 * sin_lat * sin_lat)
+
+    # Avoid division by zero at poles
+    if abs(cos_lat) < 1.0e-10 do
+      {num, den}
+    else
+      h = r / cos_lat - n
+      {z, r * (1.0 - @wgs84_e2 * n / (n + h))}
+    end
+  end
+
+  # Sine and cosine of atan2(y, x), taken straight from its arguments with a
+  # single square root
+  defp sin_cos_of_atan2(y, x) do
+    hyp = sqrt(x * x + y * y)
+    {y / hyp, x / hyp}
+  end
+
   # Calculate Greenwich Mean Sidereal Time (GMST) in radians
   # Simplified version using linear approximation
   defp calculate_gmst(datetime) do
-    # Convert to Julian Date
-    jd = datetime_to_julian_date(datetime)
+    # Julian Date at 0h UTC plus the elapsed fraction of the day; the time of
+    # day is derived once and shared by the century count and the rotation
+    {jd_at_0h, day_fraction} = julian_date_parts(datetime)
 
     # Calculate centuries since J2000
-    t = (jd - 2_451_545.0) / 36_525.0
-
-    # GMST at 0h UT1 (in degrees)
-    gmst0 = 100.46061837 + 36_000.770053608 * t + 0.000387933 * t * t
+    t = (jd_at_0h + day_fraction - 2_451_545.0) / 36_525.0
 
-    # Add rotation for time of day (including microseconds)
-    microseconds = elem(datetime.microsecond, 0)
+    # GMST at 0h UT1 (in degrees), polynomial in t evaluated in Horner form
+    gmst0 = 100.46061837 + t * (36_000.770053608 + t * 0.000387933)
 
-    ut_hours =
-      datetime.hour + datetime.minute / 60.0 + datetime.second / 3600.0 +
-        microseconds / 3_600_000_000.0
+    # Add rotation for time of day (360.98564724 degrees per day)
+    gmst = gmst0 + 360.98564724 * day_fraction
 
-    gmst = gmst0 + 360.98564724 * ut_hours / 24.0
-
-    # Convert to radians and normalize to [0, 2π]
-    gmst_rad = gmst * pi() / 180.0
-    rem_float(gmst_rad, 2.0 * pi())
+    # Convert to radians and normalize to [0, 2π] (up to rounding)
+    gmst_rad = gmst * @deg_to_rad
+    rem_float(gmst_rad, @two_pi)
   end
 
-  # Convert DateTime to Julian Date (Meeus algorithm, referenced to 0h UTC)
-  defp datetime_to_julian_date(datetime) do
-    year = datetime.year
-    month = datetime.month
-    day = datetime.day
-
+  # Split a DateTime into its Julian Date at 0h UTC and the fraction of the
+  # day since midnight (Meeus algorithm). The Julian Date of the instant is
+  # the sum of the two parts. The calendar fields are bound in a single map
+  # match rather than looked up field by field.
+  defp julian_date_parts(%{
+         year: year,
+         month: month,
+         day: day,
+         hour: hour,
+         minute: minute,
+         second: second,
+         microsecond: {microseconds, _precision}
+       }) do
     # Handle January and February
-    a = floor((14 - month) / 12)
+    # The calendar terms are small integers, so they stay in integer
+    # arithmetic (floored division) rather than float divide plus floor
+    a = Integer.floor_div(14 - month, 12)
     y = year + 4800 - a
     m = month + 12 * a - 3
 
     # Calculate Julian Day Number for 0h UTC (midnight)
     # The -32045.5 (not -32045) ensures we reference midnight, not noon
     jd_at_0h =
-      day + floor((153 * m + 2) / 5) + 365 * y + floor(y / 4) -
-        floor(y / 100) + floor(y / 400) - 32045.5
-
-    # Calculate fraction of day since midnight
-    microseconds = elem(datetime.microsecond, 0)
+      day + Integer.floor_div(153 * m + 2, 5) + 365 * y + Integer.floor_div(y, 4) -
+        Integer.floor_div(y, 100) + Integer.floor_div(y, 400) - 32045.5
 
+    # Calculate fraction of day since midnight (including microseconds)
     fraction_from_midnight =
-      datetime.hour / 24.0 +
-        datetime.minute / 1440.0 +
-        datetime.second / 86400.0 +
+      hour / 24.0 +
+        minute / 1440.0 +
+        second / 86400.0 +
         microseconds / 86_400_000_000.0
 
-    # Final Julian Date
-    jd_at_0h + fraction_from_midnight
+    {jd_at_0h, fraction_from_midnight}
   end
 
   # Floating point remainder that handles negative numbers correctly
+  # Subtracting the floored quotient lands in [0, y] up to rounding: when x / y
+  # rounds up to an integer the result can be a tiny negative number, and for a
+  # tiny negative x it can be exactly y. Either is harmless for a rotation
+  # angle, so no clamping branch is applied. :math.floor/1 keeps the quotient a
+  # float rather than converting it to an integer and back
   defp rem_float(x, y) do
-    result = x - y * floor(x / y)
-    if result < 0, do: result + y, else: result
+    x - y * :math.floor(x / y)
   end
 end
@@ -12,15 +12,25 @@ defmodule Mix.Tasks.Compile.Makesgp4 do
     # Ensure the priv directory exists
     File.mkdir_p!(priv_dir)
 
+    # This assumes the Makefile places the compiled NIF in a known location, e.g., "priv/sgp4_nif.so"
+    source_nif = Path.join(File.cwd!(), "priv/sgp4_nif.so")
+
+    if up_to_date?(source_nif, nif_so) do
+      # Nothing to rebuild or copy, so skip the make run and the copy
+      {:noop, []}
+    else
+      build(source_nif, nif_so)
+    end
+  end
+
+  defp build(source_nif, nif_so) do
     # Run `make` and capture the output
-    {output, exit_code} = System.cmd("make", [], stderr_to_stdout: true)
+    {output, exit_code} = System.cmd("make", [], make_opts())
 
     case exit_code do
       0 ->
         Mix.shell().info(output)
         # After successful compilation, copy the NIF to the priv directory
-        # This assumes the Makefile places the compiled NIF in a known location, e.g., "priv/sgp4_nif.so"
-        source_nif = Path.join(File.cwd!(), "priv/sgp4_nif.so")
         File.cp!(source_nif, nif_so)
         {:ok, [nif_so]}
 
@@ -30,10 +40,32 @@ defmodule Mix.Tasks.Compile.Makesgp4 do
     end
   end
 
+  # `make -q` exits with 0 when every target is up to date; the copied NIF
+  # must also be at least as new as the one make produced
+  defp up_to_date?(source_nif, nif_so) do
+    case System.cmd("make", ["-q"], make_opts()) do
+      {_output, 0} -> File.exists?(nif_so) and not Mix.Utils.stale?([source_nif], [nif_so])
+      {_output, _exit_code} -> false
+    end
+  end
+
+  # The running VM already knows its ERTS include directory, so hand it to
+  # make instead of letting the Makefile boot another erl to look it up
+  defp make_opts do
+    erl_include_path =
+      Path.join([
+        to_string(:code.root_dir()),
+        "erts-#{:erlang.system_info(:version)}",
+        "include"
+      ])
+
+    [stderr_to_stdout: true, env: [{"ERL_INCLUDE_PATH", erl_include_path}]]
+  end
+
   @impl Mix.Task.Compiler
   def clean do
     # Run `make clean`
-    case System.cmd("make", ["clean"], stderr_to_stdout: true) do
+    case System.cmd("make", ["clean"], make_opts()) do
       {output, 0} ->
         Mix.shell().info(output)
         :ok
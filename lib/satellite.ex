@@ -0,0 +1,21 @@
+defmodule Sgp4Ex.Satellite do
+  @moduledoc """
+  A TLE together with its initialized SGP4 satellite record.
+
+  Building a satellite parses the TLE lines and runs the SGP4 initialization
+  once, so it can be propagated to many epochs without repeating that work.
+  The record itself is held by the NIF and is never modified by propagation.
+  """
+
+  alias Sgp4Ex.TLE
+
+  @type t :: %__MODULE__{
+          tle: TLE.t(),
+          satrec: reference()
+        }
+
+  defstruct [
+    :tle,
+    :satrec
+  ]
+end
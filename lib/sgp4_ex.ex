@@ -3,6 +3,7 @@ defmodule Sgp4Ex do
   SGP4 propagation module for Elixir.
   """
 
+  alias Sgp4Ex.Satellite
   alias Sgp4Ex.TLE
   alias Sgp4Ex.TemeState
 
@@ -55,14 +56,19 @@ defmodule Sgp4Ex do
   end
 
   defp validate_ascii(line1, line2) do
-    if String.to_charlist(line1) |> Enum.all?(&(&1 <= 127)) and
-         String.to_charlist(line2) |> Enum.all?(&(&1 <= 127)) do
+    if ascii?(line1) and ascii?(line2) do
       :ok
     else
       {:error, "TLE lines contain non-ASCII characters"}
     end
   end
 
+  # Scans the bytes directly instead of building a charlist; any non-ASCII
+  # character has a byte above 127 in its UTF-8 encoding
+  defp ascii?(<<c, rest::binary>>) when c <= 127, do: ascii?(rest)
+  defp ascii?(<<>>), do: true
+  defp ascii?(_), do: false
+
   defp clean_tle_line(line, max_length) do
     line
     |> remove_trailing_whitespace()
@@ -72,7 +78,7 @@ defmodule Sgp4Ex do
   defp remove_trailing_whitespace(line), do: String.trim_trailing(line)
 
   defp truncate_to_valid_tle_length(line, max_length) when byte_size(line) > max_length do
-    String.slice(line, 0..(max_length - 1))
+    binary_part(line, 0, max_length)
   end
 
   defp truncate_to_valid_tle_length(line, _max_length), do: line
@@ -87,13 +93,13 @@ defmodule Sgp4Ex do
 
   defp validate_line1_positions(line) do
     cond do
-      String.length(line) < 64 ->
+      byte_size(line) < 64 ->
         {:error, format_error_message()}
 
       not String.starts_with?(line, "1 ") ->
         {:error, format_error_message()}
 
-      not all_positions_valid?(line, line1_positions()) ->
+      not line1_positions_valid?(line) ->
         {:error, format_error_message()}
 
       true ->
@@ -103,13 +109,13 @@ defmodule Sgp4Ex do
 
   defp validate_line2_positions(line) do
     cond do
-      String.length(line) < 68 ->
+      byte_size(line) < 68 ->
         {:error, format_error_message()}
 
       not String.starts_with?(line, "2 ") ->
         {:error, format_error_message()}
 
-      not all_positions_valid?(line, line2_positions()) ->
+      not line2_positions_valid?(line) ->
         {:error, format_error_message()}
 
       true ->
@@ -117,33 +123,31 @@ defmodule Sgp4Ex do
     end
   end
 
-  defp all_positions_valid?(line, positions) do
-    Enum.all?(positions, fn {pos, expected_char} ->
-      String.at(line, pos) == expected_char
-    end)
-  end
-
-  defp line1_positions do
-    [{8, " "}, {23, "."}, {32, " "}, {34, "."}, {43, " "}, {52, " "}, {61, " "}, {63, " "}]
-  end
-
-  defp line2_positions do
-    [
-      {7, " "},
-      {11, "."},
-      {16, " "},
-      {20, "."},
-      {25, " "},
-      {33, " "},
-      {37, "."},
-      {42, " "},
-      {46, "."},
-      {51, " "}
-    ]
-  end
+  # The fixed separator columns of each line are checked with one binary
+  # match rather than indexing the line once per column.
+  # Line 1: spaces at 8, 32, 43, 52, 61, 63 and periods at 23, 34
+  defp line1_positions_valid?(
+         <<_::binary-size(8), " ", _::binary-size(14), ".", _::binary-size(8), " ", _, ".",
+           _::binary-size(8), " ", _::binary-size(8), " ", _::binary-size(8), " ", _, " ",
+           _::binary>>
+       ),
+       do: true
+
+  defp line1_positions_valid?(_line), do: false
+
+  # Line 2: spaces at 7, 16, 25, 33, 42, 51 and periods at 11, 20, 37, 46
+  defp line2_positions_valid?(
+         <<_::binary-size(7), " ", _::binary-size(3), ".", _::binary-size(4), " ",
+           _::binary-size(3), ".", _::binary-size(4), " ", _::binary-size(7), " ",
+           _::binary-size(3), ".", _::binary-size(4), " ", _::binary-size(3), ".",
+           _::binary-size(4), " ", _::binary>>
+       ),
+       do: true
+
+  defp line2_positions_valid?(_line), do: false
 
   defp validate_matching_satellite_numbers(line1, line2) do
-    if String.slice(line1, 2..6) == String.slice(line2, 2..6) do
+    if field(line1, 2, 6) == field(line2, 2, 6) do
       :ok
     else
       {:error, "Object numbers in lines 1 and 2 do not match"}
@@ -157,23 +161,23 @@ defmodule Sgp4Ex do
   defp extract_tle_fields(line1, line2) do
     try do
       fields = %{
-        catalog_number: String.slice(line1, 2..6),
+        catalog_number: field(line1, 2, 6),
         classification: String.at(line1, 7) || "U",
-        intldesg: String.trim_trailing(String.slice(line1, 9..16)),
-        two_digit_year: String.slice(line1, 18..19) |> String.trim() |> String.to_integer(),
-        epochdays: String.slice(line1, 20..31) |> parse_float(),
-        ndot: String.slice(line1, 33..42) |> parse_float(),
+        intldesg: String.trim_trailing(field(line1, 9, 16)),
+        two_digit_year: field(line1, 18, 19) |> String.trim() |> String.to_integer(),
+        epochdays: field(line1, 20, 31) |> parse_float(),
+        ndot: field(line1, 33, 42) |> parse_float(),
         nddot: parse_nddot(line1),
         bstar: parse_bstar(line1),
         ephtype: String.at(line1, 62) |> String.to_integer(),
-        elnum: String.slice(line1, 64..67) |> String.trim() |> String.to_integer(),
-        inclo: String.slice(line2, 8..15) |> parse_float(),
-        nodeo: String.slice(line2, 17..24) |> parse_float(),
+        elnum: field(line1, 64, 67) |> String.trim() |> String.to_integer(),
+        inclo: field(line2, 8, 15) |> parse_float(),
+        nodeo: field(line2, 17, 24) |> parse_float(),
         ecco: parse_eccentricity(line2),
-        argpo: String.slice(line2, 34..41) |> parse_float(),
-        mo: String.slice(line2, 43..50) |> parse_float(),
-        no_kozai: String.slice(line2, 52..62) |> parse_float(),
-        revnum: String.slice(line2, 63..67) |> String.trim() |> String.to_integer()
+        argpo: field(line2, 34, 41) |> parse_float(),
+        mo: field(line2, 43, 50) |> parse_float(),
+        no_kozai: field(line2, 52, 62) |> parse_float(),
+        revnum: field(line2, 63, 67) |> String.trim() |> String.to_integer()
       }
 
       {:ok, fields}
@@ -182,22 +186,31 @@ defmodule Sgp4Ex do
     end
   end
 
+  # Slice a fixed-column field straight out of the line binary. The lines are
+  # validated ASCII, so byte offsets are also character columns; like
+  # String.slice/2 the range is clipped to the end of the line.
+  defp field(line, first, last) do
+    size = byte_size(line)
+    start = min(first, size)
+    binary_part(line, start, max(min(last + 1, size) - start, 0))
+  end
+
   defp parse_nddot(line1) do
     sign = if String.at(line1, 44) == "-", do: -1, else: 1
-    mantissa = ("0." <> String.slice(line1, 45..49)) |> String.trim() |> String.to_float()
-    exp = String.slice(line1, 50..51) |> String.trim() |> String.to_integer()
+    mantissa = ("0." <> field(line1, 45, 49)) |> String.trim() |> String.to_float()
+    exp = field(line1, 50, 51) |> String.trim() |> String.to_integer()
     sign * mantissa * :math.pow(10.0, exp)
   end
 
   defp parse_bstar(line1) do
     sign = if String.at(line1, 53) == "-", do: -1, else: 1
-    mantissa = ("0." <> String.slice(line1, 54..58)) |> String.trim() |> String.to_float()
-    exp = String.slice(line1, 59..60) |> String.trim() |> String.to_integer()
+    mantissa = ("0." <> field(line1, 54, 58)) |> String.trim() |> String.to_float()
+    exp = field(line1, 59, 60) |> String.trim() |> String.to_integer()
     sign * mantissa * :math.pow(10.0, exp)
   end
 
   defp parse_eccentricity(line2) do
-    ("0." <> String.replace(String.slice(line2, 26..32), " ", "0")) |> String.to_float()
+    ("0." <> String.replace(field(line2, 26, 32), " ", "0")) |> String.to_float()
   end
 
   defp build_tle_struct(fields, line1, line2) do
@@ -269,37 +282,216 @@ defmodule Sgp4Ex do
   @spec propagate_tle_to_epoch(TLE.t(), DateTime.t()) ::
           {:ok, TemeState.t()} | {:error, String.t()}
   def propagate_tle_to_epoch(tle, epoch) do
-    # SGP4 expects time since epoch in MINUTES, not seconds!
-    # Use microsecond precision for accurate time calculation
-    tsince_minutes = DateTime.diff(epoch, tle.epoch, :microsecond) / 60_000_000.0
+    tsince_minutes = minutes_since_epoch(tle, epoch)
 
-    # Call the NIF function to propagate the TLE
+    # One-off propagation: parse, initialize and propagate in a single NIF call
     case apply(SGP4NIF, :propagate_tle, [tle.line1, tle.line2, tsince_minutes]) do
       {:ok, data} ->
-        # NIF returns position in meters and velocity in m/s
-        # Convert to km and km/s for consistency
-        {x_m, y_m, z_m} = elem(data, 0)
-        {vx_m, vy_m, vz_m} = elem(data, 1)
+        {:ok, to_teme_state(data)}
 
-        {:ok,
-         %TemeState{
-           position: {x_m / 1000.0, y_m / 1000.0, z_m / 1000.0},
-           velocity: {vx_m / 1000.0, vy_m / 1000.0, vz_m / 1000.0}
-         }}
+      {:error, reason} ->
+        {:error, reason}
+    end
+  end
+
+  @doc """
+  Initialize a satellite from a TLE for repeated propagation.
+
+  The TLE lines are parsed and the SGP4 model is initialized once; the
+  returned satellite can then be propagated to any number of epochs with
+  `propagate_satellite_to_epoch/2` without repeating that work.
+
+  ## Parameters
+  - `tle`: The TLE data structure containing the satellite's orbital elements.
+
+  ## Returns
+  - `{:ok, Satellite.t()}`: The initialized satellite.
+  - `{:error, String.t()}`: An error message if the SGP4 initialization fails.
+
+  ## Example
+      iex> {:ok, tle} = Sgp4Ex.parse_tle(
+      ...>   "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993",
+      ...>   "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+      ...> )
+      iex> case Sgp4Ex.init_satellite(tle) do
+      ...>   {:ok, %Sgp4Ex.Satellite{}} -> :ok
+      ...>   _ -> :error
+      ...> end
+      :ok
+  """
+  @spec init_satellite(TLE.t()) :: {:ok, Satellite.t()} | {:error, String.t()}
+  def init_satellite(%TLE{} = tle) do
+    case apply(SGP4NIF, :init_satrec, [tle.line1, tle.line2]) do
+      {:ok, satrec} ->
+        {:ok, %Satellite{tle: tle, satrec: satrec}}
 
       {:error, reason} ->
         {:error, reason}
     end
   end
 
+  @doc """
+  Propagate an initialized satellite to a specific epoch using the SGP4 algorithm.
+
+  Gives the same result as `propagate_tle_to_epoch/2` for the satellite's TLE,
+  without parsing and initializing the TLE on every call.
+
+  ## Parameters
+  - `satellite`: A satellite initialized with `init_satellite/1`.
+  - `epoch`: The epoch to which the satellite should be propagated.
+
+  ## Returns
+  - `{:ok, TemeState.t()}`: The propagated Teme state of the satellite.
+  - `{:error, String.t()}`: An error message if the propagation fails.
+
+  ## Example
+      iex> {:ok, tle} = Sgp4Ex.parse_tle(
+      ...>   "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993",
+      ...>   "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+      ...> )
+      iex> {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      iex> epoch = ~U[2021-10-02T14:00:00Z]
+      iex> case Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch) do
+      ...>   {:ok, %Sgp4Ex.TemeState{position: {x, _, _}}} when is_float(x) -> :ok
+      ...>   _ -> :error
+      ...> end
+      :ok
+  """
+  @spec propagate_satellite_to_epoch(Satellite.t(), DateTime.t()) ::
+          {:ok, TemeState.t()} | {:error, String.t()}
+  def propagate_satellite_to_epoch(%Satellite{tle: tle, satrec: satrec}, epoch) do
+    case apply(SGP4NIF, :propagate_satrec, [satrec, minutes_since_epoch(tle, epoch)]) do
+      {:ok, data} ->
+        {:ok, to_teme_state(data)}
+
+      {:error, reason} ->
+        {:error, reason}
+    end
+  end
+
+  @doc """
+  Propagate an initialized satellite to a list of epochs in a single NIF call.
+
+  Equivalent to calling `propagate_satellite_to_epoch/2` for every epoch, but
+  the whole list is handed to the propagator at once instead of crossing into
+  native code per epoch. Every epoch gets its own result, so an epoch the
+  satellite cannot be propagated to (for example after it has decayed) does
+  not discard the states at the other epochs.
+
+  ## Parameters
+  - `satellite`: A satellite initialized with `init_satellite/1`.
+  - `epochs`: The epochs to which the satellite should be propagated.
+
+  ## Returns
+  A list with one result per epoch, in the order of `epochs`:
+  - `{:ok, TemeState.t()}`: The propagated Teme state at that epoch.
+  - `{:error, String.t()}`: An error message if propagation to that epoch fails.
+
+  ## Example
+      iex> {:ok, tle} = Sgp4Ex.parse_tle(
+      ...>   "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993",
+      ...>   "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+      ...> )
+      iex> {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      iex> epochs = [~U[2021-10-02T14:00:00Z], ~U[2021-10-02T14:01:00Z]]
+      iex> case Sgp4Ex.propagate_satellite_to_epochs(satellite, epochs) do
+      ...>   [{:ok, %Sgp4Ex.TemeState{}}, {:ok, %Sgp4Ex.TemeState{}}] -> :ok
+      ...>   _ -> :error
+      ...> end
+      :ok
+  """
+  @spec propagate_satellite_to_epochs(Satellite.t(), [DateTime.t()]) ::
+          [{:ok, TemeState.t()} | {:error, String.t()}]
+  def propagate_satellite_to_epochs(%Satellite{tle: tle, satrec: satrec}, epochs)
+      when is_list(epochs) do
+    # The TLE epoch is converted to microseconds once for the whole list, so
+    # each epoch costs a single conversion and subtraction
+    tle_epoch_us = DateTime.to_unix(tle.epoch, :microsecond)
+
+    tsince_list =
+      Enum.map(epochs, &((DateTime.to_unix(&1, :microsecond) - tle_epoch_us) / 60_000_000.0))
+
+    SGP4NIF
+    |> apply(:propagate_satrec_batch, [satrec, tsince_list])
+    |> Enum.map(&to_teme_result/1)
+  end
+
+  @doc """
+  Propagate a list of initialized satellites to the same epoch in a single NIF call.
+
+  Equivalent to calling `propagate_satellite_to_epoch/2` for every satellite,
+  but the whole list is handed to the propagator at once instead of crossing
+  into native code per satellite. Every satellite gets its own result, so one
+  that cannot be propagated (for example a decayed object in a catalog) does
+  not discard the states of the others.
+
+  ## Parameters
+  - `satellites`: Satellites initialized with `init_satellite/1`.
+  - `epoch`: The epoch to which every satellite should be propagated.
+
+  ## Returns
+  A list with one result per satellite, in the order of `satellites`:
+  - `{:ok, TemeState.t()}`: The propagated Teme state of that satellite.
+  - `{:error, String.t()}`: An error message if propagation of that satellite fails.
+
+  ## Example
+      iex> {:ok, tle} = Sgp4Ex.parse_tle(
+      ...>   "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993",
+      ...>   "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+      ...> )
+      iex> {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      iex> epoch = ~U[2021-10-02T14:00:00Z]
+      iex> case Sgp4Ex.propagate_satellites_to_epoch([satellite, satellite], epoch) do
+      ...>   [{:ok, %Sgp4Ex.TemeState{}}, {:ok, %Sgp4Ex.TemeState{}}] -> :ok
+      ...>   _ -> :error
+      ...> end
+      :ok
+  """
+  @spec propagate_satellites_to_epoch([Satellite.t()], DateTime.t()) ::
+          [{:ok, TemeState.t()} | {:error, String.t()}]
+  def propagate_satellites_to_epoch(satellites, epoch) when is_list(satellites) do
+    # The target epoch is converted once; each satellite only subtracts its own TLE epoch
+    epoch_us = DateTime.to_unix(epoch, :microsecond)
+
+    {satrecs, tsince_list} =
+      satellites
+      |> Enum.map(fn %Satellite{tle: tle, satrec: satrec} ->
+        {satrec, (epoch_us - DateTime.to_unix(tle.epoch, :microsecond)) / 60_000_000.0}
+      end)
+      |> Enum.unzip()
+
+    SGP4NIF
+    |> apply(:propagate_satrecs, [satrecs, tsince_list])
+    |> Enum.map(&to_teme_result/1)
+  end
+
+  # SGP4 expects time since epoch in MINUTES, not seconds!
+  # Use microsecond precision for accurate time calculation
+  defp minutes_since_epoch(tle, epoch) do
+    DateTime.diff(epoch, tle.epoch, :microsecond) / 60_000_000.0
+  end
+
+  # The NIFs return position in km and velocity in km/s, the units SGP4
+  # computes in, so no conversion is needed here
+  defp to_teme_state({position, velocity}) do
+    %TemeState{position: position, velocity: velocity}
+  end
+
+  # One element of a batch NIF result
+  defp to_teme_result({:ok, data}), do: {:ok, to_teme_state(data)}
+  defp to_teme_result({:error, reason}), do: {:error, reason}
+
   @doc """
   Propagate a TLE to geodetic coordinates at a specific epoch.
 
   This is a convenience function that propagates the satellite position and
-  converts it to geodetic coordinates (latitude, longitude, altitude).
+  converts it to geodetic coordinates (latitude, longitude, altitude). A
+  satellite from `init_satellite/1` can be passed instead of a TLE to reuse
+  its initialized SGP4 state.
 
   ## Parameters
-  - `tle`: The TLE data structure containing the satellite's orbital elements
+  - `tle`: The TLE data structure containing the satellite's orbital elements,
+    or a satellite initialized with `init_satellite/1`
   - `epoch`: The UTC datetime to which the TLE should be propagated
 
   ## Returns
@@ -321,13 +513,80 @@ defmodule Sgp4Ex do
       ...> end
       :ok
   """
-  @spec propagate_to_geodetic(TLE.t(), DateTime.t()) ::
+  @spec propagate_to_geodetic(TLE.t() | Satellite.t(), DateTime.t()) ::
           {:ok, %{latitude: float(), longitude: float(), altitude_km: float()}}
           | {:error, String.t()}
   def propagate_to_geodetic(%TLE{} = tle, %DateTime{} = epoch) do
+    tle
+    |> propagate_tle_to_epoch(epoch)
+    |> teme_result_to_geodetic(epoch)
+  end
+
+  def propagate_to_geodetic(%Satellite{} = satellite, %DateTime{} = epoch) do
+    satellite
+    |> propagate_satellite_to_epoch(epoch)
+    |> teme_result_to_geodetic(epoch)
+  end
+
+  @doc """
+  Propagate a list of initialized satellites to geodetic coordinates at the same epoch.
+
+  Equivalent to calling `propagate_to_geodetic/2` for every satellite, but
+  the satellites are propagated in a single NIF call and the Earth rotation
+  for `epoch` is computed once for the whole list. As with
+  `propagate_satellites_to_epoch/2`, every satellite gets its own result.
+
+  ## Parameters
+  - `satellites`: Satellites initialized with `init_satellite/1`.
+  - `epoch`: The UTC datetime to which every satellite should be propagated.
+
+  ## Returns
+  A list with one result per satellite, in the order of `satellites`:
+  - `{:ok, %{latitude: float, longitude: float, altitude_km: float}}`: The
+    geodetic coordinates of that satellite.
+  - `{:error, String.t()}`: An error message if propagation of that satellite fails.
+
+  ## Example
+      iex> {:ok, tle} = Sgp4Ex.parse_tle(
+      ...>   "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993",
+      ...>   "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+      ...> )
+      iex> {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      iex> epoch = ~U[2021-10-02T14:00:00Z]
+      iex> case Sgp4Ex.propagate_satellites_to_geodetic([satellite, satellite], epoch) do
+      ...>   [{:ok, %{latitude: lat}}, {:ok, %{latitude: lat}}] when is_float(lat) -> :ok
+      ...>   _ -> :error
+      ...> end
+      :ok
+  """
+  @spec propagate_satellites_to_geodetic([Satellite.t()], DateTime.t()) :: [
+          {:ok, %{latitude: float(), longitude: float(), altitude_km: float()}}
+          | {:error, String.t()}
+        ]
+  def propagate_satellites_to_geodetic(satellites, %DateTime{} = epoch)
+      when is_list(satellites) do
+    alias Sgp4Ex.CoordinateSystems
+
+    results = propagate_satellites_to_epoch(satellites, epoch)
+
+    # Convert the propagated positions in one pass, then put their geodetic
+    # coordinates back in place of the successful results
+    positions = for {:ok, %TemeState{position: position}} <- results, do: position
+    {:ok, geodetics} = CoordinateSystems.teme_positions_to_geodetic(positions, epoch)
+
+    {geodetic_results, []} =
+      Enum.map_reduce(results, geodetics, fn
+        {:ok, _state}, [geodetic | rest] -> {{:ok, geodetic}, rest}
+        {:error, reason}, rest -> {{:error, reason}, rest}
+      end)
+
+    geodetic_results
+  end
+
+  defp teme_result_to_geodetic(result, epoch) do
     alias Sgp4Ex.CoordinateSystems
 
-    case propagate_tle_to_epoch(tle, epoch) do
+    case result do
       {:ok, %TemeState{position: position}} ->
         CoordinateSystems.teme_to_geodetic(position, epoch)
 
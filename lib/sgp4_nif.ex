@@ -1,4 +1,15 @@
 defmodule SGP4NIF do
+  @moduledoc """
+  Low-level bindings to the C++ SGP4 implementation.
+
+  All propagation functions return `{position, velocity}` in the TEME frame,
+  with position in km and velocity in km/s. Since 0.2.0 this includes
+  `propagate_tle/3`, which previously returned meters and m/s.
+
+  Prefer the functions in `Sgp4Ex`, which wrap these results in
+  `Sgp4Ex.TemeState` structs.
+  """
+
   @on_load :load_nif
 
   def load_nif do
@@ -14,9 +25,33 @@ defmodule SGP4NIF do
     end
   end
 
-  @spec propagate_tle(binary(), binary(), float()) :: {:ok, map()} | {:error, any()}
+  @spec propagate_tle(binary(), binary(), float()) :: {:ok, tuple()} | {:error, any()}
   def propagate_tle(_line1, _line2, _tsince) do
     # fallback to return an error instead of raising
     raise "NIF not loaded"
   end
+
+  @spec init_satrec(binary(), binary()) :: {:ok, reference()} | {:error, any()}
+  def init_satrec(_line1, _line2) do
+    # fallback to return an error instead of raising
+    raise "NIF not loaded"
+  end
+
+  @spec propagate_satrec(reference(), float()) :: {:ok, tuple()} | {:error, any()}
+  def propagate_satrec(_satrec, _tsince) do
+    # fallback to return an error instead of raising
+    raise "NIF not loaded"
+  end
+
+  @spec propagate_satrec_batch(reference(), [float()]) :: [{:ok, tuple()} | {:error, any()}]
+  def propagate_satrec_batch(_satrec, _tsince_list) do
+    # fallback to return an error instead of raising
+    raise "NIF not loaded"
+  end
+
+  @spec propagate_satrecs([reference()], [float()]) :: [{:ok, tuple()} | {:error, any()}]
+  def propagate_satrecs(_satrecs, _tsince_list) do
+    # fallback to return an error instead of raising
+    raise "NIF not loaded"
+  end
 end
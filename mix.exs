@@ -4,7 +4,7 @@ defmodule Sgp4Ex.MixProject do
   def project do
     [
       app: :sgp4_ex,
-      version: "0.1.2",
+      version: "0.2.0",
       elixir: "~> 1.17",
       start_permanent: Mix.env() == :prod,
       deps: deps(),
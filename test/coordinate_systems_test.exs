@@ -122,4 +122,23 @@ defmodule Sgp4Ex.CoordinateSystemsTest do
       assert_in_delta result.altitude_km, 35786.0, 100.0
     end
   end
+
+  describe "teme_positions_to_geodetic/2" do
+    test "matches converting each position separately" do
+      datetime = ~U[2021-10-02 14:00:00Z]
+      positions = [{-3918.875, 5183.641, 1983.254}, {6778.137, 0.0, 0.0}, {0.0, 0.0, 6756.752}]
+
+      assert {:ok, results} = CoordinateSystems.teme_positions_to_geodetic(positions, datetime)
+
+      for {position, result} <- Enum.zip(positions, results) do
+        assert {:ok, ^result} = CoordinateSystems.teme_to_geodetic(position, datetime)
+      end
+    end
+
+    test "returns an empty list for no positions" do
+      datetime = ~U[2021-10-02 14:00:00Z]
+
+      assert {:ok, []} = CoordinateSystems.teme_positions_to_geodetic([], datetime)
+    end
+  end
 end
@@ -77,5 +77,19 @@ defmodule Sgp4Ex.PropagateToGeodeticTest do
       # Allow up to 20km variation due to orbital dynamics
       assert_in_delta at_epoch.altitude_km, later.altitude_km, 20.0
     end
+
+    test "accepts an initialized satellite and matches propagating the TLE" do
+      line1 = "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993"
+      line2 = "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+
+      {:ok, tle} = Sgp4Ex.parse_tle(line1, line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      epoch = ~U[2021-10-02 14:00:00Z]
+
+      assert {:ok, _geodetic} = Sgp4Ex.propagate_to_geodetic(satellite, epoch)
+
+      assert Sgp4Ex.propagate_to_geodetic(satellite, epoch) ==
+               Sgp4Ex.propagate_to_geodetic(tle, epoch)
+    end
   end
 end
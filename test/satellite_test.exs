@@ -0,0 +1,195 @@
+defmodule Sgp4Ex.SatelliteTest do
+  use ExUnit.Case
+
+  @line1 "1 25544U 98067A   21275.54791667  .00001264  00000-0  39629-5 0  9993"
+  @line2 "2 25544  51.6456  23.4367 0001234  45.6789 314.3210 15.48999999    12"
+
+  # The ISS TLE with a drag term (B* 0.01) high enough that SGP4 reports the
+  # orbit as decayed within two months of epoch
+  @decaying_line1 "1 25544U 98067A   21275.54791667  .00001264  00000-0  10000-1 0  9993"
+
+  describe "init_satellite/1" do
+    test "initializes a satellite from a TLE" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+
+      assert {:ok, %Sgp4Ex.Satellite{tle: ^tle, satrec: satrec}} = Sgp4Ex.init_satellite(tle)
+      assert is_reference(satrec)
+    end
+
+    test "returns an error for a TLE that SGP4 cannot initialize" do
+      {:ok, tle} =
+        Sgp4Ex.parse_tle(
+          "1 00000U 00000A   00001.00000000  .00000000  00000-0  00000-0 0    00",
+          "2 00000  00.0000 000.0000 0000000  00.0000 000.0000 00.00000000    00"
+        )
+
+      assert {:error, _reason} = Sgp4Ex.init_satellite(tle)
+    end
+  end
+
+  describe "propagate_satellite_to_epoch/2" do
+    test "matches propagate_tle_to_epoch/2" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+
+      for offset <- [-3600, 0, 600, 86_400] do
+        epoch = DateTime.add(tle.epoch, offset, :second)
+
+        assert Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch) ==
+                 Sgp4Ex.propagate_tle_to_epoch(tle, epoch)
+      end
+    end
+
+    test "returns position in km and velocity in km/s" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+
+      epoch = DateTime.add(tle.epoch, 3600, :second)
+      {:ok, %{position: {x, y, z}, velocity: {vx, vy, vz}}} =
+        Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch)
+
+      # ISS orbit: about 6,800 km from the Earth's center at about 7.7 km/s
+      assert_in_delta :math.sqrt(x * x + y * y + z * z), 6800.0, 100.0
+      assert_in_delta :math.sqrt(vx * vx + vy * vy + vz * vz), 7.7, 0.2
+    end
+
+    test "gives the same results when shared by concurrent processes" do
+      # Deep-space (GPS) orbit, so SGP4 writes integrator state into the record
+      {:ok, tle} =
+        Sgp4Ex.parse_tle(
+          "1 28129U 03058A   06175.57071136 -.00000104  00000-0  10000-3 0   459",
+          "2 28129  54.7298 324.8098 0048506 266.2640  93.1663  2.00562768 18443"
+        )
+
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      epochs = for days <- [-2, 1, 3, 7, 14, 30], do: DateTime.add(tle.epoch, days, :day)
+      expected = Map.new(epochs, &{&1, Sgp4Ex.propagate_satellite_to_epoch(satellite, &1)})
+
+      results =
+        1..System.schedulers_online()
+        |> Enum.flat_map(fn _ -> [epochs, Enum.reverse(epochs)] end)
+        |> Enum.map(fn order ->
+          Task.async(fn ->
+            for _ <- 1..50, epoch <- order do
+              {epoch, Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch)}
+            end
+          end)
+        end)
+        |> Task.await_many(30_000)
+        |> List.flatten()
+
+      for {epoch, result} <- results do
+        assert result == Map.fetch!(expected, epoch)
+      end
+    end
+  end
+
+  describe "propagate_satellite_to_epochs/2" do
+    test "matches propagating each epoch separately" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      epochs = for minutes <- -60..120//30, do: DateTime.add(tle.epoch, minutes * 60, :second)
+
+      results = Sgp4Ex.propagate_satellite_to_epochs(satellite, epochs)
+      assert length(results) == length(epochs)
+
+      for {epoch, result} <- Enum.zip(epochs, results) do
+        assert {:ok, %Sgp4Ex.TemeState{}} = result
+        assert Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch) == result
+      end
+    end
+
+    test "keeps the states at other epochs when one epoch fails" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@decaying_line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      epochs = for days <- [0, 60, 1], do: DateTime.add(tle.epoch, days, :day)
+
+      assert [{:ok, first}, {:error, _reason}, {:ok, last}] =
+               Sgp4Ex.propagate_satellite_to_epochs(satellite, epochs)
+
+      assert {:ok, ^first} = Sgp4Ex.propagate_satellite_to_epoch(satellite, Enum.at(epochs, 0))
+      assert {:ok, ^last} = Sgp4Ex.propagate_satellite_to_epoch(satellite, Enum.at(epochs, 2))
+    end
+
+    test "returns an empty list for no epochs" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+
+      assert [] = Sgp4Ex.propagate_satellite_to_epochs(satellite, [])
+    end
+  end
+
+  describe "propagate_satellites_to_epoch/2" do
+    test "matches propagating each satellite separately" do
+      {:ok, iss} = Sgp4Ex.parse_tle(@line1, @line2)
+
+      {:ok, gps} =
+        Sgp4Ex.parse_tle(
+          "1 28129U 03058A   06175.57071136 -.00000104  00000-0  10000-3 0   459",
+          "2 28129  54.7298 324.8098 0048506 266.2640  93.1663  2.00562768 18443"
+        )
+
+      satellites =
+        for tle <- [iss, gps] do
+          {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+          satellite
+        end
+
+      epoch = ~U[2021-10-02 14:00:00Z]
+
+      results = Sgp4Ex.propagate_satellites_to_epoch(satellites, epoch)
+      assert [{:ok, %Sgp4Ex.TemeState{}}, {:ok, %Sgp4Ex.TemeState{}}] = results
+
+      for {satellite, result} <- Enum.zip(satellites, results) do
+        assert Sgp4Ex.propagate_satellite_to_epoch(satellite, epoch) == result
+      end
+    end
+
+    test "keeps the other satellites when one fails" do
+      {:ok, iss} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, decaying} = Sgp4Ex.parse_tle(@decaying_line1, @line2)
+      {:ok, iss_satellite} = Sgp4Ex.init_satellite(iss)
+      {:ok, decaying_satellite} = Sgp4Ex.init_satellite(decaying)
+      epoch = DateTime.add(iss.epoch, 60, :day)
+
+      assert [{:ok, state}, {:error, _reason}, {:ok, state}] =
+               Sgp4Ex.propagate_satellites_to_epoch(
+                 [iss_satellite, decaying_satellite, iss_satellite],
+                 epoch
+               )
+
+      assert {:ok, ^state} = Sgp4Ex.propagate_satellite_to_epoch(iss_satellite, epoch)
+    end
+  end
+
+  describe "propagate_satellites_to_geodetic/2" do
+    test "matches propagating each satellite to geodetic separately" do
+      {:ok, tle} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, satellite} = Sgp4Ex.init_satellite(tle)
+      epochs = [~U[2021-10-02 14:00:00Z], ~U[2021-10-02 15:30:00Z]]
+
+      for epoch <- epochs do
+        assert [{:ok, geodetic}, {:ok, geodetic}] =
+                 Sgp4Ex.propagate_satellites_to_geodetic([satellite, satellite], epoch)
+
+        assert {:ok, ^geodetic} = Sgp4Ex.propagate_to_geodetic(satellite, epoch)
+      end
+    end
+
+    test "keeps the other satellites when one fails" do
+      {:ok, iss} = Sgp4Ex.parse_tle(@line1, @line2)
+      {:ok, decaying} = Sgp4Ex.parse_tle(@decaying_line1, @line2)
+      {:ok, iss_satellite} = Sgp4Ex.init_satellite(iss)
+      {:ok, decaying_satellite} = Sgp4Ex.init_satellite(decaying)
+      epoch = DateTime.add(iss.epoch, 60, :day)
+
+      assert [{:error, _reason}, {:ok, geodetic}, {:error, _}] =
+               Sgp4Ex.propagate_satellites_to_geodetic(
+                 [decaying_satellite, iss_satellite, decaying_satellite],
+                 epoch
+               )
+
+      assert {:ok, ^geodetic} = Sgp4Ex.propagate_to_geodetic(iss_satellite, epoch)
+    end
+  end
+end
@@ -17,9 +17,13 @@ defmodule Sgp4ExTest do
     result = apply(SGP4NIF, :propagate_tle, [line1, line2, tsince])
 
     case result do
-      {:ok, data} ->
+      {:ok, {{x, y, z}, {vx, vy, vz}} = data} ->
         IO.inspect(data, label: "Data from NIF")
 
+        # Position in km and velocity in km/s (ISS: ~6,800 km, ~7.7 km/s)
+        assert_in_delta :math.sqrt(x * x + y * y + z * z), 6800.0, 100.0
+        assert_in_delta :math.sqrt(vx * vx + vy * vy + vz * vz), 7.7, 0.2
+
       {:error, reason} ->
         flunk("NIF returned error: #{inspect(reason)}")
 